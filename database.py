@@ -3,7 +3,23 @@
 Обеспечивает чтение, запись, добавление и редактирование записей.
 '''
 
-from utils import validate_date, validate_group, validate_conclusion, parse_date
+import sys
+
+from utils import validate_date, validate_conclusion, parse_date, normalize_date, process_record
+from utils import print_record, print_records_list
+from utils import SPECIALISTS
+
+
+_IO_BUFFER_SIZE = 128 * 1024
+
+_YEAR_TO_GROUP = {
+    2022: 'младшая', 2023: 'младшая',
+    2020: 'средняя', 2021: 'средняя',
+    2018: 'старшая', 2019: 'старшая'
+}
+_VALID_GROUPS = frozenset(_YEAR_TO_GROUP.values())
+_REQUIRED = frozenset(('фамилия', 'имя', 'дата_рождения', 'группа'))
+_FIELD_KEYS = {key: sys.intern(key) for key in (*_REQUIRED, *SPECIALISTS)}
 
 
 def validate_group_by_birth_year(birth_date, group):
@@ -17,84 +33,86 @@ def validate_group_by_birth_year(birth_date, group):
     Returns:
         tuple: (bool, str) - успешность проверки и сообщение об ошибке
     '''
-    try:
-        year, month, day = parse_date(birth_date)
+    parsed = parse_date(birth_date)
+    if parsed is None:
+        return False, f'Некорректная дата рождения: {birth_date}'
 
-        group_years = {
-            'младшая': [2022, 2023],
-            'средняя': [2020, 2021],
-            'старшая': [2018, 2019]
-        }
+    year = parsed[0]
 
-        if group not in group_years:
-            return False, f'Неизвестная группа: {group}'
+    if group not in _VALID_GROUPS:
+        return False, f'Неизвестная группа "{group}": группа должна быть "младшая", "средняя" или "старшая"'
 
-        if year not in group_years[group]:
-            expected_years = group_years[group]
-            return False, f'Ребенок {year} года рождения не может быть в {group} группе'
+    if _YEAR_TO_GROUP.get(year) != group:
+        return False, f'Ребенок {year} года рождения не может быть в {group} группе'
 
-        return True, ''
-
-    except Exception as e:
-        return False, f'Ошибка при проверке соответствия группы и года рождения: {e}'
+    return True, ''
 
 
-def load_database(filename='data.txt'):
+def _iter_raw_records(lines):
     '''
-    Загружает данные из файла.
+    Разбирает строки файла на записи, разделенные пустыми строками.
 
     Args:
-        filename (str): Имя файла с данными
+        lines (iterable): Строки файла
 
-    Returns:
-        tuple: (список записей, сообщение об ошибке)
+    Yields:
+        dict: Запись в том виде, в каком она прочитана из файла
     '''
-    records = []
-
-    try:
-        with open(filename, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except FileNotFoundError:
-        return records, f'Файл {filename} не найден'
-    except Exception as e:
-        return records, f'Ошибка при чтении файла: {e}'
-
     current_record = {}
-    valid_records = 0
 
     for line in lines:
         line = line.strip()
 
         if not line:
             if current_record:
-                required = ['фамилия', 'имя', 'дата_рождения', 'группа']
-                if all(field in current_record for field in required):
-                    birth_date = current_record['дата_рождения']
-                    group = current_record['группа']
-                    is_valid, error_msg = validate_group_by_birth_year(birth_date, group)
-                    if is_valid:
-                        records.append(current_record)
-                        valid_records += 1
+                yield current_record
                 current_record = {}
             continue
 
-        if ':' in line:
-            key, value = line.split(':', 1)
-            key = key.strip().lower()
-            value = value.strip()
-            current_record[key] = value
+        # Строка уже очищена по краям: у ключа могут остаться пробелы
+        # только справа, у значения - только слева.
+        key, sep, value = line.partition(':')
+        if sep:
+            key = key.rstrip().lower()
+            current_record[_FIELD_KEYS.get(key, key)] = value.lstrip()
 
     if current_record:
-        required = ['фамилия', 'имя', 'дата_рождения', 'группа']
-        if all(field in current_record for field in required):
-            birth_date = current_record['дата_рождения']
-            group = current_record['группа']
-            is_valid, error_msg = validate_group_by_birth_year(birth_date, group)
-            if is_valid:
-                records.append(current_record)
-                valid_records += 1
+        yield current_record
+
+
+def load_database(filename='data.txt'):
+    '''
+    Загружает данные из файла.
+
+    Args:
+        filename (str): Имя файла с данными
 
-    return records, f'Загружено {valid_records} записей'
+    Returns:
+        tuple: (список записей, сообщение об ошибке)
+    '''
+    try:
+        with open(filename, 'r', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as file:
+            raw_records = list(_iter_raw_records(file))
+    except FileNotFoundError:
+        return [], f'Файл {filename} не найден'
+    except Exception as e:
+        return [], f'Ошибка при чтении файла: {e}'
+
+    records = [
+        record for record in raw_records
+        if _REQUIRED <= record.keys()
+        and validate_group_by_birth_year(record['дата_рождения'], record['группа'])[0]
+    ]
+
+    # Старые файлы могут содержать даты без ведущих нулей (2020-1-5)
+    for record in records:
+        record['дата_рождения'] = normalize_date(record['дата_рождения'])
+
+    message = f'Загружено {len(records)} записей'
+    skipped = len(raw_records) - len(records)
+    if skipped:
+        message += f', пропущено некорректных записей: {skipped}'
+    return records, message
 
 
 def save_database(records, filename='data.txt'):
@@ -109,19 +127,26 @@ def save_database(records, filename='data.txt'):
         str: Сообщение о результате
     '''
     try:
-        with open(filename, 'w', encoding='utf-8') as file:
-            for record in records:
-                file.write(f'фамилия: {record["фамилия"]}\n')
-                file.write(f'имя: {record["имя"]}\n')
-                file.write(f'дата_рождения: {record["дата_рождения"]}\n')
-                file.write(f'группа: {record["группа"]}\n')
+        lines = []
+        append = lines.append
+
+        for record in records:
+            append(f'фамилия: {record["фамилия"]}\n')
+            append(f'имя: {record["имя"]}\n')
+            append(f'дата_рождения: {record["дата_рождения"]}\n')
+            append(f'группа: {record["группа"]}\n')
+
+            for specialist in SPECIALISTS:
+                conclusion = record.get(specialist)
+                if conclusion is not None:
+                    append(f'{specialist}: {conclusion}\n')
 
-                specialists = ['невропатолог', 'отоларинголог', 'ортопед', 'окулист']
-                for specialist in specialists:
-                    if specialist in record:
-                        file.write(f'{specialist}: {record[specialist]}\n')
+            append('\n')
 
-                file.write('\n')
+        payload = ''.join(lines).encode('utf-8')
+
+        with open(filename, 'wb') as file:
+            file.write(payload)
 
         return f'Данные сохранены в файл {filename}'
 
@@ -170,15 +195,8 @@ def add_record(records):
             continue
 
         year, month, day = parse_date(birth_date)
-        year = int(year)
-
-        available_groups = []
-        if year in [2022, 2023]:
-            available_groups.append('младшая')
-        if year in [2020, 2021]:
-            available_groups.append('средняя')
-        if year in [2018, 2019]:
-            available_groups.append('старшая')
+        group_for_year = _YEAR_TO_GROUP.get(year)
+        available_groups = [group_for_year] if group_for_year else []
 
         if not available_groups:
             print(f'Ошибка: ребенок {year} года рождения не подходит ни для одной группы')
@@ -187,16 +205,12 @@ def add_record(records):
         print(f'Доступные группы для {year} года рождения: {", ".join(available_groups)}')
         group = input(f'Группа ({"/".join(available_groups)}): ').strip().lower()
 
-        if not validate_group(group):
-            print('Ошибка: группа должна быть "младшая", "средняя" или "старшая"')
-            continue
-
         is_valid_group, error_msg_group = validate_group_by_birth_year(birth_date, group)
         if not is_valid_group:
             print(f'Ошибка: {error_msg_group}')
             continue
 
-        new_record['дата_рождения'] = birth_date
+        new_record['дата_рождения'] = normalize_date(birth_date)
         new_record['группа'] = group
         break
 
@@ -220,6 +234,7 @@ def add_record(records):
                 break
             print('Ошибка: заключение должно быть "здоров" или "нуждается в лечении"')
 
+    process_record(new_record)
     records.append(new_record)
     return records, 'Запись успешно добавлена'
 
@@ -238,8 +253,7 @@ def edit_record(records):
         return records, 'Нет записей для редактирования'
 
     print('\nСПИСОК ЗАПИСЕЙ:')
-    for i, record in enumerate(records, 1):
-        print(f'{i}. {record["фамилия"]} {record["имя"]} - {record["группа"]}')
+    print_records_list(records)
 
     while True:
         try:
@@ -250,7 +264,6 @@ def edit_record(records):
             index = int(choice) - 1
             if 0 <= index < len(records):
                 record = records[index]
-                from utils import print_record
                 print_record(record, index + 1)
 
                 print('\nКакое поле изменить?')
@@ -270,6 +283,7 @@ def edit_record(records):
                     new_value = input('Новая фамилия: ').strip()
                     if new_value:
                         record['фамилия'] = new_value
+                        process_record(record)
                     return records, 'Фамилия изменена'
 
                 elif field_choice == '2':
@@ -290,16 +304,13 @@ def edit_record(records):
                     if not is_valid_group:
                         return records, f'Ошибка: {error_msg_group}'
 
-                    record['дата_рождения'] = new_birth_date
+                    record['дата_рождения'] = normalize_date(new_birth_date)
                     return records, 'Дата рождения изменена'
 
                 elif field_choice == '4':
                     current_birth_date = record['дата_рождения']
                     new_group = input('Новая группа (младшая/средняя/старшая): ').strip().lower()
 
-                    if not validate_group(new_group):
-                        return records, 'Ошибка: неверное название группы'
-
                     is_valid, error_msg = validate_group_by_birth_year(current_birth_date, new_group)
                     if not is_valid:
                         return records, f'Ошибка: {error_msg}'
@@ -320,9 +331,11 @@ def edit_record(records):
                     if not new_value:
                         if specialist in record:
                             del record[specialist]
+                        process_record(record)
                         return records, f'Заключение {specialist} удалено'
                     elif validate_conclusion(new_value):
                         record[specialist] = new_value
+                        process_record(record)
                         return records, f'Заключение {specialist} изменено'
                     else:
                         return records, 'Ошибка: неверное заключение'
@@ -358,8 +371,7 @@ def delete_record(records):
         return records, 'Нет записей для удаления'
 
     print('\nСПИСОК ЗАПИСЕЙ:')
-    for i, record in enumerate(records, 1):
-        print(f'{i}. {record["фамилия"]} {record["имя"]} - {record["группа"]}')
+    print_records_list(records)
 
     while True:
         try:
@@ -4,7 +4,7 @@
 '''
 
 from database import load_database, save_database, add_record, edit_record, delete_record
-from utils import print_record, clear_screen, print_records_table
+from utils import print_record, clear_screen, print_records_table, process_records_batch
 
 
 def show_main_menu():
@@ -256,6 +256,7 @@ def main():
 
     # Загрузка данных из файла
     records, message = load_database()
+    records = process_records_batch(records)
     print(message)
 
     # Если файл не найден, предлагаем создать тестовые данные
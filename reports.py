@@ -3,9 +3,16 @@
 Содержит функции для создания всех требуемых отчетов.
 '''
 
-from sort import sort_by_health_then_name, sort_by_birth_date, sort_by_group_then_name
-from sort import sort_by_health_group_name
-from utils import needs_treatment, print_records_table, count_healthy_specialists
+from sort import sort_by_health_then_name, sort_by_birth_date, sort_by_health_group_name
+from utils import print_records_table
+
+
+_GROUP_MAP = {
+    '1': 'младшая',
+    '2': 'средняя',
+    '3': 'старшая',
+    '4': 'все'
+}
 
 
 def generate_full_report(records):
@@ -45,17 +52,10 @@ def generate_group_report(records):
     print('3. Старшая')
     print('4. Все группы')
 
-    group_map = {
-        '1': 'младшая',
-        '2': 'средняя',
-        '3': 'старшая',
-        '4': 'все'
-    }
-
     while True:
         choice = input('Ваш выбор (1-4): ').strip()
-        if choice in group_map:
-            selected_group = group_map[choice]
+        if choice in _GROUP_MAP:
+            selected_group = _GROUP_MAP[choice]
             break
         print('Ошибка: выберите 1, 2, 3 или 4')
 
@@ -63,7 +63,7 @@ def generate_group_report(records):
         group_records = records
         title = 'ОТЧЕТ ПО ВСЕМ ГРУППАМ (сортировка по дате рождения)'
     else:
-        group_records = [r for r in records if r['группа'].lower() == selected_group]
+        group_records = [r for r in records if r['группа'] == selected_group]
         title = f'ОТЧЕТ ПО {selected_group.upper()} ГРУППЕ (сортировка по дате рождения)'
 
     if not group_records:
@@ -90,7 +90,7 @@ def generate_treatment_report(records):
         input('\nНажмите Enter для продолжения...')
         return
 
-    treatment_records = [r for r in records if needs_treatment(r)]
+    treatment_records = [r for r in records if r['_needs_treatment']]
 
     if not treatment_records:
         print('\nНет детей, нуждающихся в лечении!')
@@ -1,51 +1,18 @@
 '''
 Модуль с алгоритмами сортировки.
-Реализует метод Хоара (быстрая сортировка) для различных критериев.
+Сортирует записи по различным критериям встроенной устойчивой сортировкой.
 '''
 
-from utils import parse_date
+from operator import itemgetter
 
 
-def quicksort(arr, key_func, reverse=False):
-    '''
-    Реализация быстрой сортировки (метод Хоара).
-
-    Args:
-        arr (list): Список для сортировки
-        key_func (function): Функция для получения ключа сортировки
-        reverse (bool): True для сортировки по убыванию
-
-    Returns:
-        list: Отсортированный список
-    '''
-    if len(arr) <= 1:
-        return arr
-
-    pivot = arr[len(arr) // 2]
-    pivot_key = key_func(pivot)
-
-    less = []
-    equal = []
-    greater = []
-
-    for item in arr:
-        item_key = key_func(item)
-        if item_key < pivot_key:
-            less.append(item)
-        elif item_key == pivot_key:
-            equal.append(item)
-        else:
-            greater.append(item)
-
-    if reverse:
-        return quicksort(greater, key_func, reverse) + equal + quicksort(less, key_func, reverse)
-    else:
-        return quicksort(less, key_func, reverse) + equal + quicksort(greater, key_func, reverse)
+_GROUP_ORDER = {'младшая': 1, 'средняя': 2, 'старшая': 3}
 
 
 def sort_by_health_then_name(records):
     '''
     Сортировка по убыванию количества здоровых заключений, затем по фамилии.
+    Использует служебные поля '_healthy_count' и '_surname_lc' (см. utils.process_record).
 
     Args:
         records (list): Список записей
@@ -53,18 +20,17 @@ def sort_by_health_then_name(records):
     Returns:
         list: Отсортированный список
     '''
-    from utils import count_healthy_specialists
 
     def key_func(record):
-        healthy = count_healthy_specialists(record)
-        return (-healthy, record['фамилия'].lower())
+        return (-record['_healthy_count'], record['_surname_lc'])
 
-    return quicksort(records, key_func)
+    return sorted(records, key=key_func)
 
 
 def sort_by_birth_date(records):
     '''
     Сортировка по дате рождения (год, месяц, день).
+    Даты в формате ГГГГ-ММ-ДД упорядочиваются как строки.
 
     Args:
         records (list): Список записей
@@ -72,17 +38,15 @@ def sort_by_birth_date(records):
     Returns:
         list: Отсортированный список
     '''
-
-    def key_func(record):
-        year, month, day = parse_date(record['дата_рождения'])
-        return (year, month, day)
-
-    return quicksort(records, key_func)
+    return sorted(records, key=itemgetter('дата_рождения'))
 
 
 def sort_by_group_then_name(records):
     '''
     Сортировка по группе, затем по фамилии.
+    Групп всего три, поэтому записи раскладываются по корзинам групп
+    (неизвестные группы - в конец), и каждая корзина сортируется по фамилии.
+    Использует служебное поле '_surname_lc' (см. utils.process_record).
 
     Args:
         records (list): Список записей
@@ -90,14 +54,19 @@ def sort_by_group_then_name(records):
     Returns:
         list: Отсортированный список
     '''
-    group_order = {'младшая': 1, 'средняя': 2, 'старшая': 3}
+    buckets = {group: [] for group in _GROUP_ORDER}
+    other = []
 
-    def key_func(record):
-        group = record['группа'].lower()
-        group_num = group_order.get(group, 99)
-        return (group_num, record['фамилия'].lower())
+    for record in records:
+        buckets.get(record['группа'], other).append(record)
 
-    return quicksort(records, key_func)
+    surname_key = itemgetter('_surname_lc')
+    result = []
+    for bucket in (*buckets.values(), other):
+        bucket.sort(key=surname_key)
+        result.extend(bucket)
+
+    return result
 
 
 def sort_by_health_group_name(records):
@@ -110,11 +79,4 @@ def sort_by_health_group_name(records):
     Returns:
         list: Отсортированный список
     '''
-    group_order = {'младшая': 1, 'средняя': 2, 'старшая': 3}
-
-    def key_func(record):
-        group = record['группа'].lower()
-        group_num = group_order.get(group, 99)
-        return (group_num, record['фамилия'].lower())
-
-    return quicksort(records, key_func)
+    return sort_by_group_then_name(records)
@@ -3,6 +3,26 @@
 Содержит функции валидации, форматирования и отображения данных.
 '''
 
+import os
+import re
+import sys
+from functools import lru_cache
+from operator import itemgetter
+
+
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})')
+# Максимальное число дней в месяце (индекс - номер месяца)
+_MONTH_DAYS = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_VALID_CONCLUSIONS = frozenset(('здоров', 'нуждается в лечении'))
+SPECIALISTS = ('невропатолог', 'отоларинголог', 'ортопед', 'окулист')
+_HEALTHY = 'здоров'
+_SICK = 'нуждается в лечении'
+_LIST_FIELDS = itemgetter('фамилия', 'имя', 'группа')
+
+# Пустая команда включает в консоли Windows обработку ANSI-последовательностей
+if os.name == 'nt':
+    os.system('')
+
 
 def validate_date(date_str):
     '''
@@ -14,47 +34,25 @@ def validate_date(date_str):
     Returns:
         tuple: (bool, str) - успешность проверки и сообщение об ошибке
     '''
-    try:
-        parts = date_str.split('-')
-        if len(parts) != 3:
-            return False, 'Дата должна быть в формате ГГГГ-ММ-ДД'
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return False, 'Дата должна быть в формате ГГГГ-ММ-ДД'
 
-        year, month, day = parts
-        if not (year.isdigit() and month.isdigit() and day.isdigit()):
-            return False, 'Год, месяц и день должны быть числами'
+    year, month, day = map(int, match.groups())
 
-        year_int, month_int, day_int = int(year), int(month), int(day)
+    if not (2018 <= year <= 2023):
+        return False, 'Год рождения должен быть между 2018 и 2023'
+    if not (1 <= month <= 12):
+        return False, 'Месяц должен быть от 1 до 12'
 
-        if not (2018 <= year_int <= 2023):
-            return False, 'Год рождения должен быть между 2018 и 2023'
-        if not (1 <= month_int <= 12):
-            return False, 'Месяц должен быть от 1 до 12'
-        if not (1 <= day_int <= 31):
+    if not (1 <= day <= _MONTH_DAYS[month]):
+        if not (1 <= day <= 31):
             return False, 'День должен быть от 1 до 31'
-
-        if month_int == 2 and day_int > 29:
+        if month == 2:
             return False, 'В феврале не может быть больше 29 дней'
+        return False, f'В месяце {month} не может быть больше 30 дней'
 
-        if month_int in [4, 6, 9, 11] and day_int > 30:
-            return False, f'В месяце {month_int} не может быть больше 30 дней'
-
-        return True, ''
-
-    except Exception as e:
-        return False, f'Ошибка при проверке даты: {e}'
-
-
-def validate_group(group):
-    '''
-    Проверяет корректность названия группы.
-
-    Args:
-        group (str): Название группы
-
-    Returns:
-        bool: True если группа корректна
-    '''
-    return group.lower() in ['младшая', 'средняя', 'старшая']
+    return True, ''
 
 
 def validate_conclusion(conclusion):
@@ -67,9 +65,10 @@ def validate_conclusion(conclusion):
     Returns:
         bool: True если заключение корректно
     '''
-    return conclusion.lower() in ['здоров', 'нуждается в лечении']
+    return conclusion.lower() in _VALID_CONCLUSIONS
 
 
+@lru_cache(maxsize=4096)
 def parse_date(date_str):
     '''
     Разбирает строку с датой на составляющие.
@@ -79,14 +78,33 @@ def parse_date(date_str):
 
     Returns:
         tuple: (год, месяц, день) как целые числа
+        или None, если строка не является датой
     '''
     parts = date_str.split('-')
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
     return int(parts[0]), int(parts[1]), int(parts[2])
 
 
+def normalize_date(date_str):
+    '''
+    Дополняет месяц и день даты ведущими нулями, чтобы даты
+    упорядочивались как строки.
+
+    Args:
+        date_str (str): Дата, для которой parse_date не возвращает None
+
+    Returns:
+        str: Дата в формате ГГГГ-ММ-ДД
+    '''
+    year, month, day = parse_date(date_str)
+    return f'{year:04d}-{month:02d}-{day:02d}'
+
+
 def count_healthy_specialists(record):
     '''
     Подсчитывает количество специалистов, давших заключение 'здоров'.
+    Заключения должны быть приведены к нижнему регистру (см. process_record).
 
     Args:
         record (dict): Запись о ребенке
@@ -94,17 +112,13 @@ def count_healthy_specialists(record):
     Returns:
         int: Количество здоровых заключений (0-4)
     '''
-    specialists = ['невропатолог', 'отоларинголог', 'ортопед', 'окулист']
-    count = 0
-    for specialist in specialists:
-        if record.get(specialist, '').lower() == 'здоров':
-            count += 1
-    return count
+    return list(map(record.get, SPECIALISTS)).count(_HEALTHY)
 
 
 def needs_treatment(record):
     '''
     Проверяет, нуждается ли ребенок в лечении.
+    Заключения должны быть приведены к нижнему регистру (см. process_record).
 
     Args:
         record (dict): Запись о ребенке
@@ -112,11 +126,41 @@ def needs_treatment(record):
     Returns:
         bool: True если нуждается в лечении хотя бы по одному специалисту
     '''
-    specialists = ['невропатолог', 'отоларинголог', 'ортопед', 'окулист']
-    for specialist in specialists:
-        if record.get(specialist, '').lower() == 'нуждается в лечении':
-            return True
-    return False
+    return _SICK in map(record.get, SPECIALISTS)
+
+
+def process_record(record):
+    '''
+    Приводит заключения специалистов к нижнему регистру и вычисляет
+    служебные поля записи, используемые отчетами и сортировками.
+    Служебные поля начинаются с '_' и не сохраняются в файл.
+
+    Args:
+        record (dict): Запись о ребенке
+    '''
+    for specialist in SPECIALISTS:
+        conclusion = record.get(specialist)
+        if conclusion is not None:
+            record[specialist] = conclusion.lower()
+
+    record['_healthy_count'] = count_healthy_specialists(record)
+    record['_needs_treatment'] = needs_treatment(record)
+    record['_surname_lc'] = record['фамилия'].lower()
+
+
+def process_records_batch(records):
+    '''
+    Вычисляет служебные поля для всех записей.
+
+    Args:
+        records (list): Список записей
+
+    Returns:
+        list: Тот же список записей с заполненными служебными полями
+    '''
+    for record in records:
+        process_record(record)
+    return records
 
 
 def print_record(record, index=None):
@@ -124,7 +168,7 @@ def print_record(record, index=None):
     Выводит запись о ребенке в удобочитаемом формате.
 
     Args:
-        record (dict): Запись о ребенке
+        record (dict): Запись о ребенке (обработанная process_record)
         index (int, optional): Номер записи
     '''
     if index is not None:
@@ -142,9 +186,8 @@ def print_record(record, index=None):
     print(f'  Ортопед: {record.get("ортопед", "НЕТ ДАННЫХ")}')
     print(f'  Окулист: {record.get("окулист", "НЕТ ДАННЫХ")}')
 
-    healthy_count = count_healthy_specialists(record)
-    print(f'\nЗдоровых заключений: {healthy_count}/4')
-    if needs_treatment(record):
+    print(f'\nЗдоровых заключений: {record["_healthy_count"]}/4')
+    if record['_needs_treatment']:
         print('СТАТУС: Требуется лечение')
     else:
         print('СТАТУС: Здоров')
@@ -155,34 +198,50 @@ def print_records_table(records, title=''):
     Выводит список записей в виде таблицы.
 
     Args:
-        records (list): Список записей
+        records (list): Список записей (обработанных process_records_batch)
         title (str): Заголовок таблицы
     '''
+    lines = []
+
     if title:
-        print('\n' + '=' * 80)
-        print(f'{title:^80}')
-        print('=' * 80)
+        lines.append('\n' + '=' * 80)
+        lines.append(f'{title:^80}')
+        lines.append('=' * 80)
 
     if not records:
-        print('Нет данных для отображения')
-        return
+        lines.append('Нет данных для отображения')
+    else:
+        # Заголовок таблицы
+        lines.append('№   Фамилия           Имя               Группа     Дата рожд.  Здор./Всего')
+        lines.append('-' * 80)
+
+        for i, record in enumerate(records, 1):
+            needs_treat = 'ЛЕЧ' if record['_needs_treatment'] else '   '
+            lines.append(f'{i:<3} {record["фамилия"]:<17} {record["имя"]:<16} '
+                         f'{record["группа"]:<10} {record["дата_рождения"]:<11} '
+                         f'{record["_healthy_count"]:>2}/4 {needs_treat}')
 
-    # Заголовок таблицы
-    header = '№   Фамилия           Имя               Группа     Дата рожд.  Здор./Всего'
-    print(header)
-    print('-' * 80)
+    lines.append('')
+    sys.stdout.write('\n'.join(lines))
 
-    for i, record in enumerate(records, 1):
-        healthy = count_healthy_specialists(record)
-        needs_treat = 'ЛЕЧ' if needs_treatment(record) else '   '
-        print(f'{i:<3} {record["фамилия"]:<17} {record["имя"]:<16} '
-              f'{record["группа"]:<10} {record["дата_рождения"]:<11} '
-              f'{healthy:>2}/4 {needs_treat}')
+
+def print_records_list(records):
+    '''
+    Выводит краткий нумерованный список записей одной операцией записи.
+
+    Args:
+        records (list): Список записей
+    '''
+    sys.stdout.write(''.join(
+        f'{i}. {last_name} {first_name} - {group}\n'
+        for i, (last_name, first_name, group) in enumerate(map(_LIST_FIELDS, records), 1)
+    ))
 
 
 def clear_screen():
     '''
     Очищает экран консоли.
     '''
-    print('\n' * 50)
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 